@@ -6,6 +6,8 @@ class MVCC:
         self.ctr = 0
         self.tx_ctr = [i for i in range(10)]
         self.version_table = {}
+        self.rollback_count = 0
+        self.reexecuted_ops = 0
 
         try:
             if input_sequence[-1] == ';':
@@ -93,6 +95,8 @@ class MVCC:
 
     def rollback(self, tx):
         tx_sequence = [op for op in self.result if op['transaction'] == tx and op['operation'] != 'rollback']
+        self.rollback_count += 1
+        self.reexecuted_ops += len(tx_sequence)
         tx_sequence += [op for op in self.sequence if op['transaction'] == tx]
         self.sequence = [op for op in self.sequence if op['transaction'] != tx]
         self.sequence += tx_sequence
@@ -101,8 +105,9 @@ class MVCC:
     def commit(self, tx):
         self.result.append({'operation': 'commit', 'transaction': tx})
 
-    def run(self):
-        while len(self.sequence) > 0:
+    def run(self, max_rollbacks=None):
+        # max_rollbacks stops a schedule that keeps restarting the same transactions
+        while len(self.sequence) > 0 and (max_rollbacks is None or self.rollback_count <= max_rollbacks):
             current = self.sequence.pop(0)
             if current['operation'] == 'R':
                 self.read(current['transaction'], current['table'])
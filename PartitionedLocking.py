@@ -0,0 +1,253 @@
+import collections
+import multiprocessing
+import zlib
+
+from TwoPhaseLocking import TwoPhaseLocking
+
+
+def shard_worker(inbox, outbox) -> None:
+    # lock tables for the items hashed to this shard
+    shared_lock_table = {}
+    exclusive_lock_table = {}
+    # tables held by each transaction, so a release only touches its own locks
+    held_shared = {}
+    held_exclusive = {}
+
+    while True:
+        batch = inbox.get()
+        if batch is None:
+            break
+        replies = []
+        for operation, transaction, timestamp, table in batch:
+            if operation == 'S':
+                holder = exclusive_lock_table.get(table)
+                if holder is not None and holder[0] != transaction:
+                    replies.append('wait' if timestamp < holder[1] else 'die')
+                elif holder is not None or transaction in shared_lock_table.get(table, {}):
+                    replies.append('held')
+                else:
+                    shared_lock_table.setdefault(table, {})[transaction] = timestamp
+                    held_shared.setdefault(transaction, {})[table] = None
+                    replies.append('SL')
+            elif operation == 'X':
+                holder = exclusive_lock_table.get(table)
+                sharers = {t: ts for t, ts in shared_lock_table.get(table, {}).items() if t != transaction}
+                if holder is not None and holder[0] == transaction:
+                    replies.append('held')
+                elif holder is not None or sharers:
+                    # wait-die: only an older transaction may wait for the lock holders
+                    holders = [holder[1]] if holder is not None else list(sharers.values())
+                    replies.append('wait' if all(timestamp < ts for ts in holders) else 'die')
+                else:
+                    upgrade = transaction in shared_lock_table.get(table, {})
+                    if upgrade:
+                        shared_lock_table.pop(table)
+                        del held_shared[transaction][table]
+                    exclusive_lock_table[table] = (transaction, timestamp)
+                    held_exclusive.setdefault(transaction, {})[table] = None
+                    replies.append('UPL' if upgrade else 'XL')
+            elif operation == 'US':
+                released = list(held_shared.pop(transaction, {}))
+                for k in released:
+                    del shared_lock_table[k][transaction]
+                    if not shared_lock_table[k]:
+                        del shared_lock_table[k]
+                replies.append(released)
+            elif operation == 'UX':
+                released = list(held_exclusive.pop(transaction, {}))
+                for k in released:
+                    del exclusive_lock_table[k]
+                replies.append(released)
+            else:
+                replies.append('invalid')
+        outbox.put(replies)
+
+
+class LockManager:
+    def __init__(self, shards: int) -> None:
+        if shards < 1:
+            raise ValueError("Number of shards must be at least 1")
+        self.shards = shards
+        self.inboxes = []
+        self.outboxes = []
+        self.workers = []
+        for _ in range(shards):
+            inbox = multiprocessing.Queue()
+            outbox = multiprocessing.Queue()
+            worker = multiprocessing.Process(target=shard_worker, args=(inbox, outbox), daemon=True)
+            worker.start()
+            self.inboxes.append(inbox)
+            self.outboxes.append(outbox)
+            self.workers.append(worker)
+
+    def shard_of(self, table: str) -> int:
+        return zlib.crc32(str(table).encode()) % self.shards
+
+    def send(self, batches: dict) -> dict:
+        # send every batch before waiting so the shards work in parallel
+        for shard, batch in batches.items():
+            self.inboxes[shard].put(batch)
+        return {shard: self.outboxes[shard].get() for shard in batches}
+
+    def request(self, operation: str, transaction: int, timestamp: int, table: str):
+        shard = self.shard_of(table)
+        return self.send({shard: [(operation, transaction, timestamp, table)]})[shard][0]
+
+    def release(self, transaction: int, shards, operations=('US', 'UX')) -> list:
+        # all unlock operations go in one batch per shard, so a release costs a single round
+        replies = self.send({shard: [(operation, transaction, 0, None) for operation in operations] for shard in shards})
+        return [[table for shard in sorted(replies) for table in replies[shard][i]] for i in range(len(operations))]
+
+    def execute(self, transactions: dict, window: int = 500) -> dict:
+        # run transactions concurrently under wait-die, each holding its locks until it has all of them;
+        # every round sends one batch per shard so the shards work in parallel
+        stats = {"transactions": 0, "locks": 0, "lock_requests": 0, "unlock_requests": 0, "waits": 0, "dies": 0, "rounds": 0}
+        # a transaction without lock requests has nothing to coordinate
+        pending = collections.deque(tx for tx in sorted(transactions) if transactions[tx])
+        active = {}
+        touched = {}
+        releasing = []
+        while pending or active or releasing:
+            while pending and len(active) < window:
+                tx = pending.popleft()
+                active[tx] = 0
+                touched.setdefault(tx, set())
+
+            batches = {}
+            # unlocks go first so a restarted transaction does not trip over its own old locks
+            for tx in releasing:
+                for shard in touched[tx]:
+                    batches.setdefault(shard, []).extend([('US', tx, 0, None), ('UX', tx, 0, None)])
+                    stats["unlock_requests"] += 2
+                touched[tx] = set()
+            releasing = []
+            requests = {}
+            for tx, step in active.items():
+                operation, table = transactions[tx][step]
+                shard = self.shard_of(table)
+                requests.setdefault(shard, []).append((tx, len(batches.get(shard, []))))
+                # the transaction id doubles as its wait-die timestamp, kept across restarts
+                batches.setdefault(shard, []).append((operation, tx, tx, table))
+                stats["lock_requests"] += 1
+
+            replies = self.send(batches)
+            stats["rounds"] += 1
+            for shard, txs in requests.items():
+                for tx, idx in txs:
+                    reply = replies[shard][idx]
+                    if reply == 'wait':
+                        stats["waits"] += 1
+                    elif reply == 'die':
+                        stats["dies"] += 1
+                        active[tx] = 0
+                        releasing.append(tx)
+                    else:
+                        # only shards that granted a lock need an unlock later
+                        touched[tx].add(shard)
+                        active[tx] += 1
+                        if active[tx] == len(transactions[tx]):
+                            del active[tx]
+                            releasing.append(tx)
+                            stats["transactions"] += 1
+                            stats["locks"] += len(transactions[tx])
+            # a dying transaction restarts only after its locks are gone
+            for tx in releasing:
+                if tx in active:
+                    active.pop(tx)
+                    pending.appendleft(tx)
+        return stats
+
+    def close(self) -> None:
+        for inbox in self.inboxes:
+            inbox.put(None)
+        for worker in self.workers:
+            worker.join()
+
+
+class PartitionedLocking(TwoPhaseLocking):
+    def __init__(self, input_sequence: str, shards: int = 4) -> None:
+        super().__init__(input_sequence)
+        if shards < 1:
+            raise ValueError("Number of shards must be at least 1")
+        self.shards = shards
+        self.lock_manager = None
+        # shards each transaction holds locks on, so commit and abort only contact those
+        self.touched = {}
+        # wait-die verdict of the last refused lock request
+        self.verdict = None
+
+    # The scheduler replays one fixed interleaving, so every lock request here is a single
+    # blocking round-trip and the shards never overlap. LockManager.execute is the pipelined path.
+    def lock(self, operation: str, transaction: int, table: str) -> bool:
+        # timestamps are global, so every shard takes the same wait-die decision
+        # and waits stay ordered from older to younger across shards
+        reply = self.lock_manager.request(operation, transaction, self.timestamp.index(transaction), table)
+        if reply in ('wait', 'die'):
+            self.verdict = reply
+            return False
+        self.touched.setdefault(transaction, set()).add(self.lock_manager.shard_of(table))
+        if reply != 'held':
+            self.result.append(
+                {"operation": reply, "transaction": transaction, "table": table})
+            self.transaction_history.append({"transaction" : transaction, "table": table, "operation": reply, "status": "Success"})
+        return True
+
+    def shared_lock(self, transaction: int, table: str) -> bool:
+        return self.lock('S', transaction, table)
+
+    def exclusive_lock(self, transaction: int, table: str) -> bool:
+        return self.lock('X', transaction, table)
+
+    def log_unlocks(self, current: dict, tables: list) -> None:
+        for t in tables:
+            self.result.append(
+                {"operation": "UL", "transaction": current["transaction"], "table": t})
+            self.transaction_history.append({"transaction" : current["transaction"], "table": t, "operation": "UL", "status": "Success"})
+
+    def clear_shared_lock(self, current: dict) -> None:
+        shared, = self.lock_manager.release(current["transaction"], self.touched.get(current["transaction"], set()), ('US',))
+        self.log_unlocks(current, shared)
+
+    def clear_exclusive_lock(self, current: dict) -> None:
+        exclusive, = self.lock_manager.release(current["transaction"], self.touched.get(current["transaction"], set()), ('UX',))
+        self.log_unlocks(current, exclusive)
+
+    def release_locks(self, current: dict) -> None:
+        # shared and exclusive locks are released together in one round
+        shared, exclusive = self.lock_manager.release(current["transaction"], self.touched.pop(current["transaction"], set()))
+        self.log_unlocks(current, shared)
+        self.log_unlocks(current, exclusive)
+
+    def abort(self, current: dict) -> None:
+        # drop the locks on every shard the transaction touched
+        self.lock_manager.release(current["transaction"], self.touched.pop(current["transaction"], set()))
+        super().abort(current)
+
+    def wait_die(self, current: dict) -> None:
+        if self.verdict == 'wait':
+            # add the current transaction to the queue
+            self.queue.append(current)
+            self.transaction_history.append({"transaction": current["transaction"], "table": current["table"], "operation": current["operation"], "status": "Queue"})
+        else:  # abort the current transaction
+            self.abort(current)
+
+    def run(self) -> None:
+        self.lock_manager = LockManager(self.shards)
+        try:
+            super().run()
+        finally:
+            self.lock_manager.close()
+            self.lock_manager = None
+
+
+if __name__ == "__main__":
+    try:
+        pl = PartitionedLocking(input("Enter sequence (delimited by ;): "))
+        pl.run()
+        print(pl.result_string())
+        for res in pl.transaction_history:
+            print(res)
+
+    except (ValueError, IndexError) as e:
+        print("Error: ", e)
+        exit(1)
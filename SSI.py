@@ -0,0 +1,252 @@
+from MVCC import MVCC
+
+
+class Transaction:
+    def __init__(self, tx_id):
+        self.tx_id = tx_id
+        self.reads = set()
+        self.writes = set()
+        self.executed = []
+        self.start = None
+        self.commit = None
+
+
+class SSI:
+    def __init__(self, input_sequence: str) -> None:
+        self.sequence = []
+        self.result = []
+        self.ctr = 0
+        self.transactions = {}
+        self.version_table = {}
+        # rw-antidependency edges as (reader, writer) pairs
+        self.rw_edges = set()
+        self.doomed = set()
+        self.rollback_count = 0
+        self.reexecuted_ops = 0
+
+        try:
+            if input_sequence[-1] == ';':
+                input_sequence = input_sequence[:-1]
+            input_sequence = input_sequence.split(';')
+            for input in input_sequence:
+                input = input.strip()
+                if input[0] == 'R' or input[0] == 'W':
+                    self.sequence.append(
+                        {"operation": input[0], "transaction": int(input[1]), "table": input[3]})
+                elif input[0] == 'C':
+                    id = int(input[1])
+                    self.sequence.append(
+                        {"operation": input[0], "transaction": id})
+                    # make sure that the transaction has a read or write operation
+                    if len([x for x in self.sequence if x["transaction"] == id and (x["operation"] == 'R' or x["operation"] == 'W')]) == 0:
+                        raise ValueError("Transaction has no read or write operation")
+                else:
+                    raise ValueError("Invalid operation detected")
+            # Make sure that every read or write operation has a commit operation
+            for x in self.sequence:
+                if x["operation"] == 'R' or x["operation"] == 'W':
+                    if len([y for y in self.sequence if y["transaction"] == x["transaction"] and y["operation"] == 'C']) == 0:
+                        raise ValueError("Transaction has no commit operation")
+
+            # Make sure every table is a single alphabet character, any symbol or number is not allowed
+            if any(len(x["table"]) != 1 or not x["table"].isalpha() for x in self.sequence if x["operation"] == 'R' or x["operation"] == 'W'):
+                raise ValueError("Invalid table name")
+
+            for x in self.sequence:
+                if x["transaction"] not in self.transactions:
+                    self.transactions[x["transaction"]] = Transaction(x["transaction"])
+
+        except ValueError as e:
+            raise ValueError(e)
+        except Exception as e:
+            raise ValueError(e)
+
+    def begin(self, tx):
+        # take the snapshot on the first operation of the transaction
+        if self.transactions[tx].start is None:
+            self.transactions[tx].start = self.ctr
+
+    def concurrent(self, t1, t2):
+        # two transactions overlap if neither committed before the other took its snapshot
+        a, b = self.transactions[t1], self.transactions[t2]
+        if a.commit is not None and a.commit <= b.start:
+            return False
+        if b.commit is not None and b.commit <= a.start:
+            return False
+        return a.start is not None and b.start is not None
+
+    def add_edge(self, reader, writer):
+        self.rw_edges.add((reader, writer))
+        # a pivot has both an incoming and an outgoing rw-antidependency,
+        # edges to a doomed transaction no longer count as it is going to restart anyway
+        return {tx for tx in (reader, writer) if self.is_pivot(tx, set())}
+
+    def is_pivot(self, tx, excluded):
+        edges = [(r, w) for (r, w) in self.rw_edges if not {r, w} & (self.doomed | excluded)]
+        return any(w == tx for (_, w) in edges) and any(r == tx for (r, _) in edges)
+
+    def resolve_pivots(self, tx, pivots):
+        # abort the current transaction if it is a pivot itself or if a committed pivot can no longer be aborted
+        abort = any(pivot == tx or self.transactions[pivot].commit is not None for pivot in pivots)
+        # doom every other running pivot that stays a pivot once an aborted transaction's edges are gone
+        for pivot in pivots:
+            if pivot != tx and self.transactions[pivot].commit is None and (not abort or self.is_pivot(pivot, {tx})):
+                self.doomed.add(pivot)
+        return abort
+
+    def visible_version(self, tx, table):
+        start = self.transactions[tx].start
+        visible = [v for v in self.version_table[table] if v['commit'] <= start]
+        return max(visible, key=lambda v: v['commit'])
+
+    def read(self, current):
+        tx, table = current['transaction'], current['table']
+        if table not in self.version_table:
+            self.version_table[table] = [{'transaction': None, 'commit': 0, 'version': 0}]
+        t = self.transactions[tx]
+        t.reads.add(table)
+
+        pivots = set()
+        # every concurrent writer of this table is newer than what the snapshot sees
+        for other in self.transactions.values():
+            if other.tx_id != tx and table in other.writes and self.concurrent(tx, other.tx_id):
+                pivots |= self.add_edge(tx, other.tx_id)
+        if self.resolve_pivots(tx, pivots):
+            self.rollback(current, "dangerous structure")
+            return
+
+        version = None if table in t.writes else self.visible_version(tx, table)['version']
+        t.executed.append(current)
+        self.result.append({'operation': 'R', 'transaction': tx, 'table': table, 'snapshot': t.start, 'version': version})
+
+    def write(self, current):
+        tx, table = current['transaction'], current['table']
+        if table not in self.version_table:
+            self.version_table[table] = [{'transaction': None, 'commit': 0, 'version': 0}]
+        t = self.transactions[tx]
+
+        # first-committer-wins
+        if any(v['commit'] > t.start for v in self.version_table[table]):
+            self.rollback(current, "write-write conflict")
+            return
+
+        t.writes.add(table)
+        pivots = set()
+        for other in self.transactions.values():
+            if other.tx_id != tx and table in other.reads and self.concurrent(tx, other.tx_id):
+                pivots |= self.add_edge(other.tx_id, tx)
+        if self.resolve_pivots(tx, pivots):
+            self.rollback(current, "dangerous structure")
+            return
+
+        t.executed.append(current)
+        self.result.append({'operation': 'W', 'transaction': tx, 'table': table, 'snapshot': t.start, 'version': None})
+
+    def commit(self, current):
+        tx = current['transaction']
+        t = self.transactions[tx]
+        if any(v['commit'] > t.start for table in t.writes for v in self.version_table[table]):
+            self.rollback(current, "write-write conflict")
+            return
+
+        self.ctr += 1
+        t.commit = self.ctr
+        for table in t.writes:
+            self.version_table[table].append({'transaction': tx, 'commit': t.commit, 'version': t.commit})
+        self.result.append({'operation': 'commit', 'transaction': tx, 'timestamp': t.commit})
+
+    def rollback(self, current, reason):
+        tx = current['transaction']
+        t = self.transactions[tx]
+        self.rollback_count += 1
+        # count only reads and writes, like MVCC.rollback, so the two engines stay comparable
+        self.reexecuted_ops += len(t.executed) + (1 if current['operation'] != 'C' else 0)
+        self.result.append({'operation': 'rollback', 'transaction': tx, 'reason': reason})
+
+        # restart the transaction from scratch at the end of the sequence
+        tx_sequence = t.executed + [current] + [op for op in self.sequence if op['transaction'] == tx]
+        self.sequence = [op for op in self.sequence if op['transaction'] != tx]
+        self.sequence += tx_sequence
+        self.rw_edges = {(r, w) for (r, w) in self.rw_edges if r != tx and w != tx}
+        self.doomed.discard(tx)
+        self.transactions[tx] = Transaction(tx)
+
+    def run(self, max_rollbacks=None):
+        # max_rollbacks stops a schedule that keeps restarting the same transactions
+        while len(self.sequence) > 0 and (max_rollbacks is None or self.rollback_count <= max_rollbacks):
+            current = self.sequence.pop(0)
+            self.begin(current['transaction'])
+            if current['transaction'] in self.doomed:
+                self.rollback(current, "dangerous structure")
+            elif current['operation'] == 'R':
+                self.read(current)
+            elif current['operation'] == 'W':
+                self.write(current)
+            elif current['operation'] == 'C':
+                self.commit(current)
+            else:
+                raise ValueError("Invalid operation detected")
+
+    def result_json(self):
+        res = ""
+        for t in self.result:
+            if t['operation'] == 'rollback':
+                res += f"A{t['transaction']};"
+            elif t['operation'] == 'commit':
+                res += f"C{t['transaction']};"
+            elif t['operation'] == 'R' or t['operation'] == 'W':
+                res += f"{t['operation']}{t['transaction']}({t['table']});"
+        return res
+
+    def history_json(self):
+        res = []
+        for t in self.result:
+            if t['operation'] == 'rollback':
+                res.append({"transaction": t['transaction'], "operation": f"Rollback ({t['reason']})", "status": 'Abort'})
+            elif t['operation'] == 'commit':
+                res.append({"transaction": t['transaction'], "operation": f"Commit Timestamp: {t['timestamp']}", "status": 'Commit'})
+            elif t['operation'] == 'R' or t['operation'] == 'W':
+                version = 'own write' if t['version'] is None else t['version']
+                res.append({"transaction": t['transaction'], "operation": f"{t['operation']}({t['table']}) Version: {version} Snapshot: {t['snapshot']}", "table": t['table'], "status": 'Success'})
+        return res
+
+    def __str__(self):
+        res = ""
+        for t in self.result:
+            if t['operation'] == 'rollback':
+                res += f"Transaction {t['transaction']} rolled back ({t['reason']}).\n"
+            elif t['operation'] == 'commit':
+                res += f"Transaction {t['transaction']} committed at timestamp {t['timestamp']}.\n"
+            elif t['operation'] == 'R':
+                version = 'its own write' if t['version'] is None else f"version {t['version']}"
+                res += f"Transaction {t['transaction']} Read {t['table']} at {version}. Snapshot: {t['snapshot']}.\n"
+            elif t['operation'] == 'W':
+                res += f"Transaction {t['transaction']} Write {t['table']}. Snapshot: {t['snapshot']}.\n"
+        return res
+
+
+def compare(input_sequence: str, max_rollbacks: int = 100) -> dict:
+    # rollbacks and re-executed operations of SSI against timestamp-ordering MVCC,
+    # MVCC can keep rolling back forever so both runs are capped
+    res = {}
+    for name, engine in (("mvcc", MVCC), ("ssi", SSI)):
+        cc = engine(input_sequence)
+        cc.run(max_rollbacks)
+        res[name] = {"rollbacks": cc.rollback_count, "reexecuted": cc.reexecuted_ops, "terminated": len(cc.sequence) == 0}
+    return res
+
+
+if __name__ == '__main__':
+    try:
+        sequence = input("Enter sequence (delimited by ;): ")
+        ssi = SSI(sequence)
+        ssi.run()
+        print(ssi)
+        for name, stats in compare(sequence).items():
+            if stats['terminated']:
+                print(f"{name.upper()}: {stats['rollbacks']} rollback(s), {stats['reexecuted']} re-executed operation(s)")
+            else:
+                print(f"{name.upper()}: did not terminate, stopped after {stats['rollbacks']} rollback(s)")
+    except Exception as e:
+        print("Error: ", e)
+        exit(1)
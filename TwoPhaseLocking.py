@@ -126,6 +126,10 @@ class TwoPhaseLocking:
             self.exclusive_lock_table = {
                 k: v for k, v in self.exclusive_lock_table.items() if v != current["transaction"]}
 
+    def release_locks(self, current: dict) -> None:
+        self.clear_shared_lock(current)
+        self.clear_exclusive_lock(current)
+
     def run_queue(self) -> None:
         while self.queue:
             transaction = self.queue.pop(0)
@@ -146,8 +150,7 @@ class TwoPhaseLocking:
             self.sequence.insert(1, current)
         else:
             # release the lock if any
-            self.clear_shared_lock(current)
-            self.clear_exclusive_lock(current)
+            self.release_locks(current)
 
             # add the transaction to the result
             self.result.append(current)
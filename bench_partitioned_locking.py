@@ -0,0 +1,42 @@
+import random
+import sys
+import time
+
+from PartitionedLocking import LockManager
+
+ITEMS = 100000
+TRANSACTIONS = 20000
+LOCKS_PER_TRANSACTION = 8
+WINDOW = 500
+
+
+def workload() -> dict:
+    rng = random.Random(0)
+    items = [f"item{i}" for i in range(ITEMS)]
+    return {tx: [('S' if rng.random() < 0.8 else 'X', table) for table in rng.sample(items, LOCKS_PER_TRANSACTION)]
+            for tx in range(TRANSACTIONS)}
+
+
+def benchmark(shards: int, transactions: dict) -> tuple:
+    manager = LockManager(shards)
+    try:
+        begin = time.perf_counter()
+        stats = manager.execute(transactions, WINDOW)
+        elapsed = time.perf_counter() - begin
+    finally:
+        manager.close()
+    return stats, elapsed
+
+
+if __name__ == '__main__':
+    max_shards = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    transactions = workload()
+    for shards in range(1, max_shards + 1):
+        stats, elapsed = benchmark(shards, transactions)
+        retries = stats['lock_requests'] - stats['locks']
+        conflicts = (stats['waits'] + stats['dies']) / stats['lock_requests']
+        print(f"{shards} shard(s): {stats['transactions'] / elapsed:,.0f} transactions/s, "
+              f"{stats['locks'] / elapsed:,.0f} granted locks/s, "
+              f"{retries} retried requests, "
+              f"conflict rate {conflicts:.2%} ({stats['waits']} waits, {stats['dies']} dies), "
+              f"{stats['rounds']} rounds")
@@ -3,6 +3,7 @@ from flask_cors import CORS
 from TwoPhaseLocking import TwoPhaseLocking
 from OCC import OCC
 from MVCC import MVCC
+from SSI import SSI
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}})
@@ -75,5 +76,24 @@ def mvcc_route():
     except Exception as e:
         return jsonify({"error": str(e)})
 
+@app.route('/ssi', methods=['POST'])
+def ssi_route():
+    try:
+        if request.method == 'POST':
+            data = request.get_json()
+            if data is not None and 'sequence' in data:
+                sequence = data['sequence']
+                ssi = SSI(sequence)
+                ssi.run()
+                result = ssi.result_json()
+                history = ssi.history_json()
+                return jsonify({"result": result, "history": history})
+            else:
+                return jsonify({"error": "Invalid data format"})
+        else:
+            return jsonify({"error": "Method not allowed"})
+    except Exception as e:
+        return jsonify({"error": str(e)})
+
 if __name__ == '__main__':
     app.run(debug=True)
@@ -0,0 +1,79 @@
+import itertools
+import random
+
+from SSI import SSI, compare
+
+
+def is_serializable(ssi: SSI) -> bool:
+    # keep only the last incarnation of every transaction
+    ops = {}
+    for t in ssi.result:
+        if t['operation'] == 'rollback':
+            ops[t['transaction']] = []
+        elif t['operation'] in ('R', 'W'):
+            ops.setdefault(t['transaction'], []).append(t)
+    commits = {t['timestamp']: t['transaction'] for t in ssi.result if t['operation'] == 'commit'}
+    last_writer = {}
+    for ts in sorted(commits):
+        for t in ops[commits[ts]]:
+            if t['operation'] == 'W':
+                last_writer[t['table']] = commits[ts]
+
+    # look for a serial order in which every read sees the same version and the same writes win
+    for order in itertools.permutations(ops):
+        written = {}
+        ok = True
+        for tx in order:
+            own = set()
+            for t in ops[tx]:
+                if t['operation'] == 'W':
+                    own.add(t['table'])
+                elif t['version'] is None:
+                    ok = ok and t['table'] in own
+                else:
+                    ok = ok and t['table'] not in own and written.get(t['table']) == commits.get(t['version'])
+            for table in own:
+                written[table] = tx
+        if ok and written == last_writer:
+            return True
+    return False
+
+
+def random_schedule(rng: random.Random) -> str:
+    transactions = {tx: [f"{rng.choice('RW')}{tx}({rng.choice('XY')})" for _ in range(rng.randint(1, 3))] + [f"C{tx}"]
+                    for tx in range(1, rng.randint(2, 4) + 1)}
+    schedule = []
+    while transactions:
+        tx = rng.choice(list(transactions))
+        schedule.append(transactions[tx].pop(0))
+        if not transactions[tx]:
+            del transactions[tx]
+    return ';'.join(schedule)
+
+
+def test_write_skew_across_several_pivots():
+    ssi = SSI("R2(X);R1(Y);W2(Y);R1(X);W2(Y);R1(X);R3(Y);C1;R4(X);W4(Y);W3(X);R4(Y);C4;C3;C2")
+    ssi.run()
+    assert is_serializable(ssi)
+
+
+def test_random_schedules_are_serializable():
+    rng = random.Random(0)
+    for _ in range(20000):
+        schedule = random_schedule(rng)
+        ssi = SSI(schedule)
+        ssi.run()
+        assert is_serializable(ssi), schedule
+
+
+def test_commit_abort_is_not_counted_as_reexecuted():
+    ssi = SSI("W1(X);W2(X);C1;C2")
+    ssi.run()
+    assert ssi.rollback_count == 1
+    assert ssi.reexecuted_ops == 1
+
+
+def test_compare_stops_non_terminating_mvcc():
+    stats = compare("R2(X);W1(X);C2;R1(X);C1")
+    assert not stats["mvcc"]["terminated"]
+    assert stats["ssi"]["terminated"]